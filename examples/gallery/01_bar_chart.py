@@ -8,6 +8,7 @@ bbcstyle.finalise_plot (title, subtitle, source, logo, save).
 
 from __future__ import annotations
 
+from itertools import cycle, islice
 from pathlib import Path
 from typing import Iterable, List, Optional, Tuple
 import warnings
@@ -54,15 +55,15 @@ def _theme_colors(n: int) -> List[str]:
     Return n colors taken from the current theme's axes.prop_cycle. If fewer colors
     are defined than needed, the list is cycled to length n.
     """
-    cycle = plt.rcParams.get("axes.prop_cycle")
+    prop_cycle = plt.rcParams.get("axes.prop_cycle")
     colors: List[str] = []
-    if cycle is not None:
-        colors = cycle.by_key().get("color", [])
+    if prop_cycle is not None:
+        colors = prop_cycle.by_key().get("color", [])
     if not colors:
         colors = ["#1f77b4"]  # safe fallback
 
-    # Extend by cycling if n > len(colors)
-    return [colors[i % len(colors)] for i in range(n)]
+    # Extend by cycling if n > len(colors); islice(cycle(...)) runs in C
+    return list(islice(cycle(colors), n))
 
 
 def bar_chart(
@@ -97,7 +98,7 @@ def bar_chart(
     # Let the finaliser handle titles, subtitle, source, logo, margins, and saving
     finalise_plot(
         fig=fig,
-        output_path=str(output_path) if output_path is not None else None,
+        output_path=output_path,
         # source=source,
         title=title,
         subtitle=subtitle,
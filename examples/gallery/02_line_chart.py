@@ -67,7 +67,8 @@ def line_chart(
 
     rng = np.random.default_rng(seed)
     x = np.arange(0, 24)
-    y = [np.cumsum(rng.normal(0, 0.8, size=x.size)) for _ in series_labels]
+    # One 2-D draw + cumsum along axis 1: a single allocation for all series
+    y = np.cumsum(rng.normal(0, 0.8, size=(len(series_labels), x.size)), axis=1)
 
     fig, ax = plt.subplots(figsize=(9, 5), dpi=150)
 
@@ -84,7 +85,7 @@ def line_chart(
 
     finalise_plot(
         fig=fig,
-        output_path=str(output_path) if output_path is not None else None,
+        output_path=output_path,
         # source=source,
         title=title,
         subtitle=subtitle,
@@ -97,15 +98,15 @@ def line_chart(
 
 if __name__ == "__main__":
     labels = ["North", "South", "East", "West"]
+    out_path = Path(__file__).with_suffix("").parent / "out" / "line_chart.png"
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+
     fig, _ = line_chart(
         labels,
         title="Regional index over the day",
         subtitle="Four regions, hourly values (synthetic data)",
         source="Source: Example data",
         logo_path=None,  # e.g. "assets/bbc_logo.png"
-        output_path=Path(__file__).with_suffix("").parent / "out" / "line_chart.png",
+        output_path=out_path,
     )
-    out_path = Path(__file__).with_suffix("").parent / "out" / "line_chart.png"
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    fig.savefig(out_path)
     print(f"Saved: {out_path}")
@@ -18,9 +18,10 @@ from typing import Iterable, Callable, Optional, List
 import numpy as np
 import matplotlib as mpl
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
 from matplotlib.patches import Rectangle
 from matplotlib.legend_handler import HandlerBase
-from matplotlib.ticker import FixedLocator, FuncFormatter
+from matplotlib.ticker import FixedFormatter, FixedLocator
 import warnings
 import sys
 
@@ -70,9 +71,20 @@ def make_synthetic_votes(
     positive delta via a logistic curve centered using `bias`.
     """
     rng = np.random.default_rng(seed)
-    delta = rng.normal(mean, sd, size=n)
-    delta = np.clip(delta, -0.22, 0.25)
-    p = 1.0 / (1.0 + np.exp(-(delta - bias) / max(sd * 0.75, 1e-6)))
+    # In-place chain: scale/shift/clip the standard-normal draw, then build the
+    # logistic win probability in a single scratch buffer. Same distributions
+    # as the naive expression, but peak memory stays at two n-sized arrays.
+    delta = rng.standard_normal(n)
+    delta *= sd
+    delta += mean
+    np.clip(delta, -0.22, 0.25, out=delta)
+
+    p = delta - bias
+    p *= -1.0 / max(sd * 0.75, 1e-6)
+    np.exp(p, out=p)
+    p += 1.0
+    np.reciprocal(p, out=p)
+
     won = rng.random(n) < p
     return VoteData(delta=delta, won=won)
 
@@ -80,7 +92,30 @@ def make_synthetic_votes(
 def _stacked_hist_counts(
     x: np.ndarray, mask_top: np.ndarray, bins: np.ndarray
 ) -> tuple[np.ndarray, np.ndarray]:
-    """Return counts for top mask and its complement in the same bins."""
+    """Return counts for top mask and its complement in the same bins.
+
+    On a uniform grid, bin indices are computed directly by scale-and-floor and
+    both splits are counted in one np.bincount pass over a combined
+    (bin, mask) key — a single linear scan instead of np.histogram's
+    searchsorted run twice. Non-uniform bins fall back to np.histogram.
+    """
+    bins = np.asarray(bins)
+    widths = np.diff(bins)
+    if bins.size > 1 and np.allclose(widths, widths[0]):
+        lo, hi, nb = bins[0], bins[-1], bins.size - 1
+        valid = (x >= lo) & (x <= hi)
+        xv = x[valid]
+        idx = np.floor((xv - lo) * (nb / (hi - lo))).astype(np.intp)
+        # Right edge is inclusive, matching np.histogram
+        np.clip(idx, 0, nb - 1, out=idx)
+        # Scale-and-floor can land grid-snapped values one bin off their edge;
+        # apply np.histogram's own correction step against the actual edges
+        idx[xv < bins[idx]] -= 1
+        idx[(xv >= bins[idx + 1]) & (idx + 1 < nb)] += 1
+        key = idx * 2 + mask_top[valid]
+        counts = np.bincount(key, minlength=2 * nb)
+        return counts[1::2].astype(float), counts[0::2].astype(float)
+
     c_top, _ = np.histogram(x[mask_top], bins=bins)
     c_bottom, _ = np.histogram(x[~mask_top], bins=bins)
     return c_top.astype(float), c_bottom.astype(float)
@@ -93,13 +128,32 @@ def _draw_bricklines(
     heights: np.ndarray,
     line_color: str = "white",
 ) -> None:
-    """Overlay white horizontal separators so bars look like stacked bricks."""
+    """Overlay white horizontal separators so bars look like stacked bricks.
+
+    All separators go into one LineCollection rather than one hlines call (and
+    hence one collection artist) per bar, so the renderer applies a single
+    transform to the whole batch.
+    """
+    segments = []
     for lft, w, h in zip(lefts, widths, heights):
         if h <= 1:
             continue
         # integer separators at y = 1..h-1
         ys = np.arange(1, int(h))
-        ax.hlines(ys, lft, lft + w, colors=line_color, linewidths=0.8, zorder=4)
+        segs = np.empty((ys.size, 2, 2))
+        segs[:, 0, 0] = lft
+        segs[:, 1, 0] = lft + w
+        segs[:, :, 1] = ys[:, None]
+        segments.append(segs)
+    if segments:
+        ax.add_collection(
+            LineCollection(
+                np.concatenate(segments),
+                colors=line_color,
+                linewidths=0.8,
+                zorder=4,
+            )
+        )
 
 
 class StackedSymbol:
@@ -147,7 +201,7 @@ def _percent_xtick(x: float, _: int) -> str:
 def plot_blue_wave(
     dem: VoteData,
     rep: VoteData,
-    bins: Iterable[float] = np.linspace(-0.20, 0.20, 41),
+    bins: Iterable[float] | None = None,
     title: str = "Blue wave",
     savepath: Path | None = None,
 ) -> tuple[plt.Figure, List[plt.Axes]]:
@@ -174,7 +228,12 @@ def plot_blue_wave(
     blue_dark, blue_light = "#1e5aa6", "#7fb0e6"
     red_dark, red_light = "#c72727", "#f2a7a7"
 
-    bins = np.asarray(list(bins))
+    # Zero-copy for ndarray input; the default grid is built only when needed
+    bins = (
+        np.linspace(-0.20, 0.20, 41)
+        if bins is None
+        else np.asarray(bins, dtype=np.float64)
+    )
     widths = np.diff(bins)
     lefts = bins[:-1]
 
@@ -183,7 +242,9 @@ def plot_blue_wave(
     rep_win, rep_lose = _stacked_hist_counts(rep.delta, rep.won, bins)
     dem_total = dem_win + dem_lose
     rep_total = rep_win + rep_lose
-    ymax = int(np.ceil(max(dem_total.max(), rep_total.max()) / 5.0) * 5.0)
+    dem_peak = float(dem_total.max())
+    rep_peak = float(rep_total.max())
+    ymax = int(np.ceil(max(dem_peak, rep_peak) / 5.0) * 5.0)
 
     # Figure + two upright panels
     fig, (ax_top, ax_bot) = plt.subplots(
@@ -275,10 +336,14 @@ def plot_blue_wave(
         weight="bold",
     )
 
-    # Shared X
-    ax_bot.xaxis.set_major_locator(FixedLocator([-0.20, -0.10, 0.00, 0.10, 0.20]))
+    # Shared X; ticks are a fixed list, so precompute the labels once instead of
+    # installing a FuncFormatter that re-runs Python per tick on every draw
+    xticks = [-0.20, -0.10, 0.00, 0.10, 0.20]
+    ax_bot.xaxis.set_major_locator(FixedLocator(xticks))
     ax_bot.xaxis.set_minor_locator(plt.MultipleLocator(0.05))
-    ax_bot.xaxis.set_major_formatter(FuncFormatter(_percent_xtick))
+    ax_bot.xaxis.set_major_formatter(
+        FixedFormatter([_percent_xtick(x, i) for i, x in enumerate(xticks)])
+    )
     ax_bot.tick_params(axis="x", which="both", length=0, pad=15)
     ax_bot.set_xlim(bins[0], bins[-1])
 
@@ -315,7 +380,7 @@ def plot_blue_wave(
     # Example annotations
     ax_top.annotate(
         "Sharice Davids, the joint-first\nNative American woman\nin Congress, increased\nDem vote share by 13%",
-        xy=(0.14, max(dem_total.max() * 0.16, 1)),
+        xy=(0.14, max(dem_peak * 0.16, 1)),
         xytext=(0.08, ymax * 0.6),
         ha="left",
         va="center",
@@ -326,7 +391,7 @@ def plot_blue_wave(
     )
     ax_bot.annotate(
         "Republicans held onto\nOregon 2 and Ohio 12,\ndespite a 15% swing\nagainst them",
-        xy=(-0.145, max(rep_total.max() * 0.10, 1)),
+        xy=(-0.145, max(rep_peak * 0.10, 1)),
         xytext=(-0.18, ymax * 0.7),
         ha="left",
         va="center",
@@ -345,8 +410,8 @@ def plot_blue_wave(
         divider_gap_pts=6,
     )
 
-    # Save
-    fig.tight_layout(rect=[0, 0, 1, 0.98])
+    # Save; bbox_inches="tight" already crops the figure, and tight_layout here
+    # both warned (incompatible axes) and cost an extra full layout pass
     if savepath is not None:
         savepath.parent.mkdir(parents=True, exist_ok=True)
         fig.savefig(savepath, dpi=220, bbox_inches="tight")
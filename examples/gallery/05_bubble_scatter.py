@@ -70,33 +70,45 @@ def _mock_cities(n: int = 900, seed: int = 7) -> pd.DataFrame:
             "population_m": population_m,
         }
     )
-    # Append highlighted cities
-    df.loc[len(df)] = ["Africa", 0.86, 4.1, 14.9]  # Lagos
-    df.loc[len(df)] = ["Africa", 0.90, 4.7, 15.6]  # Kinshasa
-    df.loc[df.index[-2:], "name"] = ["Lagos", "Kinshasa"]
-    return df
+    # Append highlighted cities in one concat; .loc[len(df)] = ... reindexes and
+    # copies the whole frame per appended row
+    extra = pd.DataFrame(
+        {
+            "region": ["Africa", "Africa"],
+            "vulnerability": [0.86, 0.90],
+            "growth_pct": [4.1, 4.7],
+            "population_m": [14.9, 15.6],
+            "name": ["Lagos", "Kinshasa"],
+        }
+    )
+    return pd.concat([df, extra], ignore_index=True)
+
+
+# Categorical palette for regions, built once at import time (treat as frozen)
+_PALETTE: Dict[str, str] = {
+    "Africa": "#b55b49",
+    "Asia": "#ffb339",
+    "Americas": "#0e8ccb",
+    "Europe": "#ad68f6",
+    "Oceania": "#496009",
+}
 
 
 def _palette() -> Dict[str, str]:
     """
-    Provide a categorical palette for regions.
+    Provide the categorical palette for regions.
     """
-    return {
-        "Africa": "#b55b49",
-        "Asia": "#ffb339",
-        "Americas": "#0e8ccb",
-        "Europe": "#ad68f6",
-        "Oceania": "#496009",
-    }
+    return _PALETTE
 
 
 def _bubble_sizes(pop_m: Iterable[float], base: float = 18.0) -> np.ndarray:
     """
-    Convert population in millions into scatter marker areas. Square-root scaling
-    keeps large cities prominent without overwhelming the chart.
+    Convert population in millions into scatter marker areas. Marker area scales
+    linearly with population, so the drawn radius follows the square root — the
+    perceptually honest encoding. (The old sqrt(p)**2 was an identity anyway.)
     """
-    p = np.asarray(list(pop_m))
-    return base * (np.sqrt(p) ** 2)
+    p = np.asarray(pop_m, dtype=np.float64)
+    return base * p
 
 
 def plot_bubble_scatter(
@@ -151,26 +163,24 @@ def plot_bubble_scatter(
         fontsize=14,
     )
 
-    # Plot by region for legend control
+    # One scatter for all regions: per-point color array instead of one
+    # PathCollection per group; the legend is built from the palette below.
     palette = _palette()
-    for region, g in df.groupby("region", sort=False):
-        ax.scatter(
-            g["vulnerability"],
-            g["growth_pct"],
-            s=_bubble_sizes(g["population_m"]),
-            c=palette.get(region, "#999999"),
-            alpha=0.6,
-            linewidths=0.3,
-            edgecolors="white",
-            label=region,
-        )
+    colors = df["region"].map(palette).fillna("#999999").to_numpy()
+    sizes = _bubble_sizes(df["population_m"].to_numpy())
+    ax.scatter(
+        df["vulnerability"].to_numpy(),
+        df["growth_pct"].to_numpy(),
+        s=sizes,
+        c=colors,
+        alpha=0.6,
+        linewidths=0.3,
+        edgecolors="white",
+    )
 
-    # Legend across top-left
-    present = [
-        r
-        for r in ("Africa", "Asia", "Americas", "Europe", "Oceania")
-        if r in df["region"].unique()
-    ]
+    # Legend across top-left; compute the region membership once
+    unique_regions = set(df["region"].unique())
+    present = [r for r in _PALETTE if r in unique_regions]
     handles = [
         Line2D(
             [0],
@@ -237,11 +247,11 @@ def plot_bubble_scatter(
 
     finalise_plot(
         fig=fig,
-        output_path=str(output_path),
+        output_path=output_path,
         source=source,
         title=title,
         subtitle=subtitle,
-        logo_path=str(logo_path),
+        logo_path=logo_path,
         dpi=300,
         logo_zoom=0.5,
         logo_vertical_pad_pts=-2,
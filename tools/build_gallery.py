@@ -0,0 +1,54 @@
+"""
+Regenerate every chart in examples/gallery in parallel.
+
+Each gallery script is independent and pays its own Matplotlib cold-start, so
+the scripts are farmed out to a process pool: workers import Matplotlib once
+and reuse it for every script they pick up, and the build finishes in roughly
+wall-clock-of-the-slowest-chart instead of the serial sum. Run as:
+
+    python tools/build_gallery.py
+
+Set BBCSTYLE_DPI=150 for a faster draft build.
+"""
+
+from __future__ import annotations
+
+import os
+import runpy
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+GALLERY_DIR = Path(__file__).resolve().parents[1] / "examples" / "gallery"
+
+
+def _render(script: Path) -> str:
+    """Execute one gallery script as __main__ with a headless backend."""
+    os.environ.setdefault("MPLBACKEND", "Agg")
+    os.chdir(GALLERY_DIR.parents[1])  # scripts use repo-relative asset paths
+    runpy.run_path(str(script), run_name="__main__")
+    return script.name
+
+
+def main() -> int:
+    scripts = sorted(GALLERY_DIR.glob("[0-9]*.py"))
+    if not scripts:
+        print(f"No gallery scripts found under {GALLERY_DIR}", file=sys.stderr)
+        return 1
+
+    failures = []
+    with ProcessPoolExecutor() as pool:
+        futures = {pool.submit(_render, script): script for script in scripts}
+        for future in as_completed(futures):
+            script = futures[future]
+            try:
+                print(f"Rendered {future.result()}")
+            except Exception as exc:
+                failures.append(script.name)
+                print(f"FAILED {script.name}: {exc}", file=sys.stderr)
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())